@@ -7,7 +7,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 
-from .client_wrapper import CannotConnect, InvalidAuth, create_client, validate_input
+from .client_wrapper import (
+    CannotConnect,
+    InvalidAuth,
+    create_client,
+    start_session,
+    validate_input,
+)
 from .const import CONF_CLIENT_DEVICE_ID, DOMAIN, PLATFORMS
 from .coordinator import JellyfinDataUpdateCoordinator
 
@@ -41,6 +47,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: JellyfinConfigEntry) ->
 
     entry.runtime_data = coordinator
     entry.async_on_unload(client.stop)
+    start_session(client)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -48,6 +48,13 @@ def create_client(device_id: str, device_name: str | None = None) -> JellyfinCli
     return client
 
 
+def start_session(client: JellyfinClient) -> None:
+    """Reuse a single HTTP session for all further requests of the client."""
+    # Without a session every request opens a new connection to the server
+    client.http.start_session()
+    client.http.keep_alive = True
+
+
 def _connect(
     client: JellyfinClient, url: str, username: str, password: str
 ) -> tuple[str, dict[str, Any]]:
@@ -8,6 +8,9 @@ from homeassistant.const import Platform, __version__ as hass_version
 
 DOMAIN: Final = "jellyfin"
 
+BROWSE_CACHE_TTL: Final = 60
+BROWSE_PAGE_SIZE: Final = 200
+
 CLIENT_VERSION: Final = hass_version
 
 COLLECTION_TYPE_MOVIES: Final = "movies"
@@ -45,11 +48,14 @@ MEDIA_TYPE_AUDIO: Final = "Audio"
 MEDIA_TYPE_NONE: Final = ""
 MEDIA_TYPE_VIDEO: Final = "Video"
 
-SUPPORTED_COLLECTION_TYPES: Final = [
+SUPPORTED_COLLECTION_TYPES: Final = {
     COLLECTION_TYPE_MUSIC,
     COLLECTION_TYPE_MOVIES,
     COLLECTION_TYPE_TVSHOWS,
-]
+}
+
+SORT_BY_INDEX: Final = "IndexNumber,SortName"
+SORT_BY_NAME: Final = "SortName"
 
 SUPPORTED_AUDIO_CODECS: Final = ["aac", "mp3", "vorbis", "wma"]
 
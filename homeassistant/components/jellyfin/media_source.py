@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from functools import lru_cache
 import logging
 import mimetypes
 import os
+import time
 from typing import Any
+from urllib.parse import urlencode
 
-from jellyfin_apiclient_python.api import jellyfin_url
+from jellyfin_apiclient_python.api import API, jellyfin_url
 from jellyfin_apiclient_python.client import JellyfinClient
 
 from homeassistant.components.media_player import BrowseError, MediaClass
@@ -16,13 +21,17 @@ from homeassistant.components.media_source import (
     MediaSource,
     MediaSourceItem,
     PlayMedia,
+    Unresolvable,
 )
 from homeassistant.core import HomeAssistant
 
 from . import JellyfinConfigEntry
 from .const import (
+    BROWSE_CACHE_TTL,
+    BROWSE_PAGE_SIZE,
     COLLECTION_TYPE_MOVIES,
     COLLECTION_TYPE_MUSIC,
+    COLLECTION_TYPE_TVSHOWS,
     CONF_AUDIO_CODEC,
     DOMAIN,
     ITEM_KEY_COLLECTION_TYPE,
@@ -46,11 +55,20 @@ from .const import (
     MEDIA_TYPE_NONE,
     MEDIA_TYPE_VIDEO,
     PLAYABLE_ITEM_TYPES,
+    SORT_BY_INDEX,
+    SORT_BY_NAME,
     SUPPORTED_COLLECTION_TYPES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Item type of the children shown when drilling into a library
+LIBRARY_CHILD_ITEM_TYPES = {
+    COLLECTION_TYPE_MUSIC: ITEM_TYPE_ARTIST,
+    COLLECTION_TYPE_MOVIES: ITEM_TYPE_MOVIE,
+    COLLECTION_TYPE_TVSHOWS: ITEM_TYPE_SERIES,
+}
+
 
 async def async_get_media_source(hass: HomeAssistant) -> MediaSource:
     """Set up Jellyfin media source."""
@@ -75,18 +93,85 @@ class JellyfinSource(MediaSource):
         self.hass = hass
         self.entry = entry
 
-        self.client = client
-        self.api = client.jellyfin
-        self.url = jellyfin_url(client, "")
+        self._client = client
+        self._url: str | None = None
+        self._artwork_query: str | None = None
+
+        self._items_cache: dict[Hashable, tuple[float, asyncio.Future[Any]]] = {}
+        self._item_cache: dict[Hashable, tuple[float, asyncio.Future[Any]]] = {}
+        # Time seen, media type and mime type of playable items seen while browsing
+        self._resolve_cache: dict[str, tuple[float, str, str]] = {}
+
+        self._builders: dict[
+            str,
+            Callable[[dict[str, Any], int], Awaitable[BrowseMediaSource]],
+        ] = {
+            ITEM_TYPE_LIBRARY: self._browse_library,
+            ITEM_TYPE_ARTIST: self._browse_artist,
+            ITEM_TYPE_ALBUM: self._browse_album,
+            ITEM_TYPE_SERIES: self._browse_series,
+            ITEM_TYPE_SEASON: self._browse_season,
+        }
+
+    @property
+    def client(self) -> JellyfinClient:
+        """Return the client of the loaded config entry."""
+        return self._client
+
+    @property
+    def api(self) -> API:
+        """Return the API of the loaded config entry."""
+        return self._client.jellyfin
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the Jellyfin server."""
+        if self._url is None:
+            self._url = jellyfin_url(self._client, "")
+        return self._url
+
+    def _update_entry(self) -> bool:
+        """Follow the loaded config entry, return False if there is none."""
+        if not (entries := self.hass.config_entries.async_loaded_entries(DOMAIN)):
+            return False
+
+        entry: JellyfinConfigEntry = entries[0]
+        client = entry.runtime_data.api_client
+        if entry is not self.entry or client is not self._client:
+            # The config entry has been reloaded or replaced, drop everything
+            # tied to the previous client
+            self.entry = entry
+            self._client = client
+            self._url = None
+            self._artwork_query = None
+            self._items_cache.clear()
+            self._item_cache.clear()
+            self._resolve_cache.clear()
+        return True
 
     async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
         """Return a streamable URL and associated mime type."""
-        media_item = await self.hass.async_add_executor_job(
-            self.api.get_item, item.identifier
-        )
-
-        stream_url = self._get_stream_url(media_item)
-        mime_type = _media_mime_type(media_item)
+        if not self._update_entry():
+            raise Unresolvable("Jellyfin is not loaded")
+
+        mime_type: str | None
+        if (
+            playable := self._resolve_cache.get(item.identifier)
+        ) is not None and time.monotonic() - playable[0] < BROWSE_CACHE_TTL:
+            _, media_type, mime_type = playable
+        else:
+            # Not browsed to before, e.g. a bookmarked item
+            media_item = await self._get_item(item.identifier)
+            media_type = media_item[ITEM_KEY_MEDIA_TYPE]
+            mime_type = _media_mime_type(media_item)
+
+        try:
+            stream_url = self._get_stream_url(item.identifier, media_type)
+        except BrowseError:
+            # Do not keep serving an item that could not be resolved
+            self._item_cache.pop(item.identifier, None)
+            self._resolve_cache.pop(item.identifier, None)
+            raise
 
         # Media Sources without a mime type have been filtered out during library creation
         assert mime_type is not None
@@ -95,26 +180,28 @@ class JellyfinSource(MediaSource):
 
     async def async_browse_media(self, item: MediaSourceItem) -> BrowseMediaSource:
         """Return a browsable Jellyfin media source."""
+        if not self._update_entry():
+            raise BrowseError("Jellyfin is not loaded")
+
+        self._expire_resolve_cache()
+
         if not item.identifier:
             return await self._build_libraries()
 
-        media_item = await self.hass.async_add_executor_job(
-            self.api.get_item, item.identifier
-        )
+        item_id, page = _parse_identifier(item.identifier)
+        media_item = await self._get_item(item_id)
 
         item_type = media_item["Type"]
-        if item_type == ITEM_TYPE_LIBRARY:
-            return await self._build_library(media_item, True)
-        if item_type == ITEM_TYPE_ARTIST:
-            return await self._build_artist(media_item, True)
-        if item_type == ITEM_TYPE_ALBUM:
-            return await self._build_album(media_item, True)
-        if item_type == ITEM_TYPE_SERIES:
-            return await self._build_series(media_item, True)
-        if item_type == ITEM_TYPE_SEASON:
-            return await self._build_season(media_item, True)
-
-        raise BrowseError(f"Unsupported item type {item_type}")
+        if (builder := self._builders.get(item_type)) is None:
+            raise BrowseError(f"Unsupported item type {item_type}")
+
+        result = await builder(media_item, page)
+        if page:
+            # Tell the pages of an item apart in the browser
+            result.identifier = f"{item_id}?page={page}"
+            result.title = f"{result.title} (page {page + 1})"
+
+        return result
 
     async def _build_libraries(self) -> BrowseMediaSource:
         """Return all supported libraries the user has access to as media sources."""
@@ -131,402 +218,451 @@ class JellyfinSource(MediaSource):
 
         libraries = await self._get_libraries()
 
-        base.children = []
-
+        # Warm up the browse cache with the children of every library so that
+        # the first drill-down into a library does not have to wait for the server
         for library in libraries:
-            base.children.append(await self._build_library(library, False))
+            self.entry.async_create_background_task(
+                self.hass,
+                self._async_prefetch_library(library),
+                f"jellyfin prefetch {library[ITEM_KEY_ID]}",
+            )
+
+        base.children = [self._build_library(library) for library in libraries]
 
         return base
 
+    async def _async_prefetch_library(self, library: dict[str, Any]) -> None:
+        """Fetch the children of a library into the browse cache."""
+        library_id = library[ITEM_KEY_ID]
+        try:
+            await self._get_children(
+                library_id,
+                LIBRARY_CHILD_ITEM_TYPES[library[ITEM_KEY_COLLECTION_TYPE]],
+                SORT_BY_NAME,
+            )
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug(
+                "Unable to prefetch children of library %s", library_id, exc_info=True
+            )
+
     async def _get_libraries(self) -> list[dict[str, Any]]:
         """Return all supported libraries a user has access to."""
         response = await self.hass.async_add_executor_job(self.api.get_media_folders)
-        libraries = response["Items"]
-        result = []
-        for library in libraries:
-            if ITEM_KEY_COLLECTION_TYPE in library:
-                if library[ITEM_KEY_COLLECTION_TYPE] in SUPPORTED_COLLECTION_TYPES:
-                    result.append(library)
-        return result
+        return [
+            library
+            for library in response["Items"]
+            if library.get(ITEM_KEY_COLLECTION_TYPE) in SUPPORTED_COLLECTION_TYPES
+        ]
 
-    async def _build_library(
-        self, library: dict[str, Any], include_children: bool
-    ) -> BrowseMediaSource:
+    def _build_library(self, library: dict[str, Any]) -> BrowseMediaSource:
         """Return a single library as a browsable media source."""
+        return BrowseMediaSource(
+            domain=DOMAIN,
+            identifier=library[ITEM_KEY_ID],
+            media_class=MediaClass.DIRECTORY,
+            media_content_type=MEDIA_TYPE_NONE,
+            title=library[ITEM_KEY_NAME],
+            can_play=False,
+            can_expand=True,
+        )
+
+    async def _browse_library(
+        self, library: dict[str, Any], page: int
+    ) -> BrowseMediaSource:
+        """Return a single library and a page of its children."""
         collection_type = library[ITEM_KEY_COLLECTION_TYPE]
 
         if collection_type == COLLECTION_TYPE_MUSIC:
-            return await self._build_music_library(library, include_children)
+            return await self._browse_music_library(library, page)
         if collection_type == COLLECTION_TYPE_MOVIES:
-            return await self._build_movie_library(library, include_children)
-        return await self._build_tv_library(library, include_children)
+            return await self._browse_movie_library(library, page)
+        return await self._browse_tv_library(library, page)
 
-    async def _build_music_library(
-        self, library: dict[str, Any], include_children: bool
+    async def _browse_music_library(
+        self, library: dict[str, Any], page: int
     ) -> BrowseMediaSource:
-        """Return a single music library as a browsable media source."""
+        """Return a single music library and a page of its artists or albums."""
         library_id = library[ITEM_KEY_ID]
-        library_name = library[ITEM_KEY_NAME]
 
-        result = BrowseMediaSource(
-            domain=DOMAIN,
-            identifier=library_id,
-            media_class=MediaClass.DIRECTORY,
-            media_content_type=MEDIA_TYPE_NONE,
-            title=library_name,
-            can_play=False,
-            can_expand=True,
+        result = self._build_library(library)
+
+        artists, total = await self._get_children(
+            library_id, ITEM_TYPE_ARTIST, SORT_BY_NAME, page
         )
+        if not total:
+            # Libraries without artists are browsed by album instead
+            result.children_media_class = MediaClass.ALBUM
+            result.children = await self._build_albums(library_id, page)
+            return result
 
-        if include_children:
-            result.children_media_class = MediaClass.ARTIST
-            result.children = await self._build_artists(library_id)
-            if not result.children:
-                result.children_media_class = MediaClass.ALBUM
-                result.children = await self._build_albums(library_id)
+        result.children_media_class = MediaClass.ARTIST
+        children = [
+            self._build_artist(artist)
+            for artist in _missing_last(artists, ITEM_KEY_NAME, total)
+        ]
+        result.children = self._add_next_page(children, library_id, page, total)
 
         return result
 
-    async def _build_artists(self, library_id: str) -> list[BrowseMediaSource]:
-        """Return all artists in the music library."""
-        artists = await self._get_children(library_id, ITEM_TYPE_ARTIST)
-        artists = sorted(
-            artists,
-            # Sort by whether an artist has an name first, then by name
-            # This allows for sorting artists with, without and with missing names
-            key=lambda k: (
-                ITEM_KEY_NAME not in k,
-                k.get(ITEM_KEY_NAME),
-            ),
-        )
-        return [await self._build_artist(artist, False) for artist in artists]
-
-    async def _build_artist(
-        self, artist: dict[str, Any], include_children: bool
-    ) -> BrowseMediaSource:
+    def _build_artist(self, artist: dict[str, Any]) -> BrowseMediaSource:
         """Return a single artist as a browsable media source."""
-        artist_id = artist[ITEM_KEY_ID]
-        artist_name = artist[ITEM_KEY_NAME]
-        thumbnail_url = self._get_thumbnail_url(artist)
-
-        result = BrowseMediaSource(
+        return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=artist_id,
+            identifier=artist[ITEM_KEY_ID],
             media_class=MediaClass.ARTIST,
             media_content_type=MEDIA_TYPE_NONE,
-            title=artist_name,
+            title=artist[ITEM_KEY_NAME],
             can_play=False,
             can_expand=True,
-            thumbnail=thumbnail_url,
+            thumbnail=self._get_thumbnail_url(artist),
         )
 
-        if include_children:
-            result.children_media_class = MediaClass.ALBUM
-            result.children = await self._build_albums(artist_id)
+    async def _browse_artist(
+        self, artist: dict[str, Any], page: int
+    ) -> BrowseMediaSource:
+        """Return a single artist and a page of their albums."""
+        result = self._build_artist(artist)
+        result.children_media_class = MediaClass.ALBUM
+        result.children = await self._build_albums(artist[ITEM_KEY_ID], page)
 
         return result
 
-    async def _build_albums(self, parent_id: str) -> list[BrowseMediaSource]:
-        """Return all albums of a single artist as browsable media sources."""
-        albums = await self._get_children(parent_id, ITEM_TYPE_ALBUM)
-        albums = sorted(
-            albums,
-            # Sort by whether an album has an name first, then by name
-            # This allows for sorting albums with, without and with missing names
-            key=lambda k: (
-                ITEM_KEY_NAME not in k,
-                k.get(ITEM_KEY_NAME),
-            ),
+    async def _build_albums(self, parent_id: str, page: int) -> list[BrowseMediaSource]:
+        """Return a page of albums of a single artist as browsable media sources."""
+        albums, total = await self._get_children(
+            parent_id, ITEM_TYPE_ALBUM, SORT_BY_NAME, page
         )
-        return [await self._build_album(album, False) for album in albums]
+        children = [
+            self._build_album(album)
+            for album in _missing_last(albums, ITEM_KEY_NAME, total)
+        ]
+        return self._add_next_page(children, parent_id, page, total)
 
-    async def _build_album(
-        self, album: dict[str, Any], include_children: bool
-    ) -> BrowseMediaSource:
+    def _build_album(self, album: dict[str, Any]) -> BrowseMediaSource:
         """Return a single album as a browsable media source."""
-        album_id = album[ITEM_KEY_ID]
-        album_title = album[ITEM_KEY_NAME]
-        thumbnail_url = self._get_thumbnail_url(album)
-
-        result = BrowseMediaSource(
+        return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=album_id,
+            identifier=album[ITEM_KEY_ID],
             media_class=MediaClass.ALBUM,
             media_content_type=MEDIA_TYPE_NONE,
-            title=album_title,
+            title=album[ITEM_KEY_NAME],
             can_play=False,
             can_expand=True,
-            thumbnail=thumbnail_url,
+            thumbnail=self._get_thumbnail_url(album),
         )
 
-        if include_children:
-            result.children_media_class = MediaClass.TRACK
-            result.children = await self._build_tracks(album_id)
+    async def _browse_album(
+        self, album: dict[str, Any], page: int
+    ) -> BrowseMediaSource:
+        """Return a single album and a page of its tracks."""
+        result = self._build_album(album)
+        result.children_media_class = MediaClass.TRACK
+        result.children = await self._build_tracks(album[ITEM_KEY_ID], page)
 
         return result
 
-    async def _build_tracks(self, album_id: str) -> list[BrowseMediaSource]:
-        """Return all tracks of a single album as browsable media sources."""
-        tracks = await self._get_children(album_id, ITEM_TYPE_AUDIO)
-        tracks = sorted(
-            tracks,
-            # Sort by whether a track has an index first, then by index
-            # This allows for sorting tracks with, without and with missing indices
-            key=lambda k: (
-                ITEM_KEY_INDEX_NUMBER not in k,
-                k.get(ITEM_KEY_INDEX_NUMBER),
-            ),
+    async def _build_tracks(self, album_id: str, page: int) -> list[BrowseMediaSource]:
+        """Return a page of tracks of a single album as browsable media sources."""
+        tracks, total = await self._get_children(
+            album_id, ITEM_TYPE_AUDIO, SORT_BY_INDEX, page
         )
-        return [
-            self._build_track(track)
-            for track in tracks
-            if _media_mime_type(track) is not None
+        children = [
+            self._build_track(track, mime_type)
+            for track, mime_type in _playable_items(
+                tracks, ITEM_KEY_INDEX_NUMBER, total
+            )
         ]
+        return self._add_next_page(children, album_id, page, total)
 
-    def _build_track(self, track: dict[str, Any]) -> BrowseMediaSource:
+    def _build_track(self, track: dict[str, Any], mime_type: str) -> BrowseMediaSource:
         """Return a single track as a browsable media source."""
-        track_id = track[ITEM_KEY_ID]
-        track_title = track[ITEM_KEY_NAME]
-        mime_type = _media_mime_type(track)
-        thumbnail_url = self._get_thumbnail_url(track)
-
-        return BrowseMediaSource(
-            domain=DOMAIN,
-            identifier=track_id,
-            media_class=MediaClass.TRACK,
-            media_content_type=mime_type,
-            title=track_title,
-            can_play=True,
-            can_expand=False,
-            thumbnail=thumbnail_url,
-        )
+        return self._build_playable(track, MediaClass.TRACK, mime_type)
 
-    async def _build_movie_library(
-        self, library: dict[str, Any], include_children: bool
+    async def _browse_movie_library(
+        self, library: dict[str, Any], page: int
     ) -> BrowseMediaSource:
-        """Return a single movie library as a browsable media source."""
-        library_id = library[ITEM_KEY_ID]
-        library_name = library[ITEM_KEY_NAME]
-
-        result = BrowseMediaSource(
-            domain=DOMAIN,
-            identifier=library_id,
-            media_class=MediaClass.DIRECTORY,
-            media_content_type=MEDIA_TYPE_NONE,
-            title=library_name,
-            can_play=False,
-            can_expand=True,
-        )
-
-        if include_children:
-            result.children_media_class = MediaClass.MOVIE
-            result.children = await self._build_movies(library_id)
+        """Return a single movie library and a page of its movies."""
+        result = self._build_library(library)
+        result.children_media_class = MediaClass.MOVIE
+        result.children = await self._build_movies(library[ITEM_KEY_ID], page)
 
         return result
 
-    async def _build_movies(self, library_id: str) -> list[BrowseMediaSource]:
-        """Return all movies in the movie library."""
-        movies = await self._get_children(library_id, ITEM_TYPE_MOVIE)
-        movies = sorted(
-            movies,
-            # Sort by whether a movies has an name first, then by name
-            # This allows for sorting moveis with, without and with missing names
-            key=lambda k: (
-                ITEM_KEY_NAME not in k,
-                k.get(ITEM_KEY_NAME),
-            ),
+    async def _build_movies(
+        self, library_id: str, page: int
+    ) -> list[BrowseMediaSource]:
+        """Return a page of movies in the movie library."""
+        movies, total = await self._get_children(
+            library_id, ITEM_TYPE_MOVIE, SORT_BY_NAME, page
         )
-        return [
-            self._build_movie(movie)
-            for movie in movies
-            if _media_mime_type(movie) is not None
+        children = [
+            self._build_movie(movie, mime_type)
+            for movie, mime_type in _playable_items(movies, ITEM_KEY_NAME, total)
         ]
+        return self._add_next_page(children, library_id, page, total)
 
-    def _build_movie(self, movie: dict[str, Any]) -> BrowseMediaSource:
+    def _build_movie(self, movie: dict[str, Any], mime_type: str) -> BrowseMediaSource:
         """Return a single movie as a browsable media source."""
-        movie_id = movie[ITEM_KEY_ID]
-        movie_title = movie[ITEM_KEY_NAME]
-        mime_type = _media_mime_type(movie)
-        thumbnail_url = self._get_thumbnail_url(movie)
-
-        return BrowseMediaSource(
-            domain=DOMAIN,
-            identifier=movie_id,
-            media_class=MediaClass.MOVIE,
-            media_content_type=mime_type,
-            title=movie_title,
-            can_play=True,
-            can_expand=False,
-            thumbnail=thumbnail_url,
-        )
+        return self._build_playable(movie, MediaClass.MOVIE, mime_type)
 
-    async def _build_tv_library(
-        self, library: dict[str, Any], include_children: bool
+    async def _browse_tv_library(
+        self, library: dict[str, Any], page: int
     ) -> BrowseMediaSource:
-        """Return a single tv show library as a browsable media source."""
-        library_id = library[ITEM_KEY_ID]
-        library_name = library[ITEM_KEY_NAME]
-
-        result = BrowseMediaSource(
-            domain=DOMAIN,
-            identifier=library_id,
-            media_class=MediaClass.DIRECTORY,
-            media_content_type=MEDIA_TYPE_NONE,
-            title=library_name,
-            can_play=False,
-            can_expand=True,
-        )
-
-        if include_children:
-            result.children_media_class = MediaClass.TV_SHOW
-            result.children = await self._build_tvshow(library_id)
+        """Return a single tv show library and a page of its series."""
+        result = self._build_library(library)
+        result.children_media_class = MediaClass.TV_SHOW
+        result.children = await self._build_tvshow(library[ITEM_KEY_ID], page)
 
         return result
 
-    async def _build_tvshow(self, library_id: str) -> list[BrowseMediaSource]:
-        """Return all series in the tv library."""
-        series = await self._get_children(library_id, ITEM_TYPE_SERIES)
-        series = sorted(
-            series,
-            # Sort by whether a seroes has an name first, then by name
-            # This allows for sorting series with, without and with missing names
-            key=lambda k: (
-                ITEM_KEY_NAME not in k,
-                k.get(ITEM_KEY_NAME),
-            ),
+    async def _build_tvshow(
+        self, library_id: str, page: int
+    ) -> list[BrowseMediaSource]:
+        """Return a page of series in the tv library."""
+        series, total = await self._get_children(
+            library_id, ITEM_TYPE_SERIES, SORT_BY_NAME, page
         )
-        return [await self._build_series(s, False) for s in series]
+        children = [
+            self._build_series(s) for s in _missing_last(series, ITEM_KEY_NAME, total)
+        ]
+        return self._add_next_page(children, library_id, page, total)
 
-    async def _build_series(
-        self, series: dict[str, Any], include_children: bool
-    ) -> BrowseMediaSource:
+    def _build_series(self, series: dict[str, Any]) -> BrowseMediaSource:
         """Return a single series as a browsable media source."""
-        series_id = series[ITEM_KEY_ID]
-        series_title = series[ITEM_KEY_NAME]
-        thumbnail_url = self._get_thumbnail_url(series)
-
-        result = BrowseMediaSource(
+        return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=series_id,
+            identifier=series[ITEM_KEY_ID],
             media_class=MediaClass.TV_SHOW,
             media_content_type=MEDIA_TYPE_NONE,
-            title=series_title,
+            title=series[ITEM_KEY_NAME],
             can_play=False,
             can_expand=True,
-            thumbnail=thumbnail_url,
+            thumbnail=self._get_thumbnail_url(series),
         )
 
-        if include_children:
-            result.children_media_class = MediaClass.SEASON
-            result.children = await self._build_seasons(series_id)
+    async def _browse_series(
+        self, series: dict[str, Any], page: int
+    ) -> BrowseMediaSource:
+        """Return a single series and a page of its seasons."""
+        result = self._build_series(series)
+        result.children_media_class = MediaClass.SEASON
+        result.children = await self._build_seasons(series[ITEM_KEY_ID], page)
 
         return result
 
-    async def _build_seasons(self, series_id: str) -> list[BrowseMediaSource]:
-        """Return all seasons in the series."""
-        seasons = await self._get_children(series_id, ITEM_TYPE_SEASON)
-        seasons = sorted(
-            seasons,
-            # Sort by whether a season has an index first, then by index
-            # This allows for sorting seasons with, without and with missing indices
-            key=lambda k: (
-                ITEM_KEY_INDEX_NUMBER not in k,
-                k.get(ITEM_KEY_INDEX_NUMBER),
-            ),
+    async def _build_seasons(
+        self, series_id: str, page: int
+    ) -> list[BrowseMediaSource]:
+        """Return a page of seasons in the series."""
+        seasons, total = await self._get_children(
+            series_id, ITEM_TYPE_SEASON, SORT_BY_INDEX, page
         )
-        return [await self._build_season(season, False) for season in seasons]
-
-    async def _build_season(
-        self, season: dict[str, Any], include_children: bool
-    ) -> BrowseMediaSource:
-        """Return a single series as a browsable media source."""
-        season_id = season[ITEM_KEY_ID]
-        season_title = season[ITEM_KEY_NAME]
-        thumbnail_url = self._get_thumbnail_url(season)
+        children = [
+            self._build_season(season)
+            for season in _missing_last(seasons, ITEM_KEY_INDEX_NUMBER, total)
+        ]
+        return self._add_next_page(children, series_id, page, total)
 
-        result = BrowseMediaSource(
+    def _build_season(self, season: dict[str, Any]) -> BrowseMediaSource:
+        """Return a single season as a browsable media source."""
+        return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=season_id,
+            identifier=season[ITEM_KEY_ID],
             media_class=MediaClass.TV_SHOW,
             media_content_type=MEDIA_TYPE_NONE,
-            title=season_title,
+            title=season[ITEM_KEY_NAME],
             can_play=False,
             can_expand=True,
-            thumbnail=thumbnail_url,
+            thumbnail=self._get_thumbnail_url(season),
         )
 
-        if include_children:
-            result.children_media_class = MediaClass.EPISODE
-            result.children = await self._build_episodes(season_id)
+    async def _browse_season(
+        self, season: dict[str, Any], page: int
+    ) -> BrowseMediaSource:
+        """Return a single season and a page of its episodes."""
+        result = self._build_season(season)
+        result.children_media_class = MediaClass.EPISODE
+        result.children = await self._build_episodes(season[ITEM_KEY_ID], page)
 
         return result
 
-    async def _build_episodes(self, season_id: str) -> list[BrowseMediaSource]:
-        """Return all episode in the season."""
-        episodes = await self._get_children(season_id, ITEM_TYPE_EPISODE)
-        episodes = sorted(
-            episodes,
-            # Sort by whether an episode has an index first, then by index
-            # This allows for sorting episodes with, without and with missing indices
-            key=lambda k: (
-                ITEM_KEY_INDEX_NUMBER not in k,
-                k.get(ITEM_KEY_INDEX_NUMBER),
-            ),
+    async def _build_episodes(
+        self, season_id: str, page: int
+    ) -> list[BrowseMediaSource]:
+        """Return a page of episodes in the season."""
+        episodes, total = await self._get_children(
+            season_id, ITEM_TYPE_EPISODE, SORT_BY_INDEX, page
         )
-        return [
-            self._build_episode(episode)
-            for episode in episodes
-            if _media_mime_type(episode) is not None
+        children = [
+            self._build_episode(episode, mime_type)
+            for episode, mime_type in _playable_items(
+                episodes, ITEM_KEY_INDEX_NUMBER, total
+            )
         ]
-
-    def _build_episode(self, episode: dict[str, Any]) -> BrowseMediaSource:
+        return self._add_next_page(children, season_id, page, total)
+
+    def _add_next_page(
+        self,
+        children: list[BrowseMediaSource],
+        parent_id: str,
+        page: int,
+        total: int,
+    ) -> list[BrowseMediaSource]:
+        """Append an entry for the next page of children if there is one."""
+        if (page + 1) * BROWSE_PAGE_SIZE < total:
+            children.append(
+                BrowseMediaSource(
+                    domain=DOMAIN,
+                    identifier=f"{parent_id}?page={page + 1}",
+                    media_class=MediaClass.DIRECTORY,
+                    media_content_type=MEDIA_TYPE_NONE,
+                    title="Next page",
+                    can_play=False,
+                    can_expand=True,
+                )
+            )
+        return children
+
+    def _build_episode(
+        self, episode: dict[str, Any], mime_type: str
+    ) -> BrowseMediaSource:
         """Return a single episode as a browsable media source."""
-        episode_id = episode[ITEM_KEY_ID]
-        episode_title = episode[ITEM_KEY_NAME]
-        mime_type = _media_mime_type(episode)
-        thumbnail_url = self._get_thumbnail_url(episode)
+        return self._build_playable(episode, MediaClass.EPISODE, mime_type)
+
+    def _build_playable(
+        self, media_item: dict[str, Any], media_class: MediaClass, mime_type: str
+    ) -> BrowseMediaSource:
+        """Return a single playable item as a browsable media source."""
+        self._remember_playable(media_item, mime_type)
 
         return BrowseMediaSource(
             domain=DOMAIN,
-            identifier=episode_id,
-            media_class=MediaClass.EPISODE,
+            identifier=media_item[ITEM_KEY_ID],
+            media_class=media_class,
             media_content_type=mime_type,
-            title=episode_title,
+            title=media_item[ITEM_KEY_NAME],
             can_play=True,
             can_expand=False,
-            thumbnail=thumbnail_url,
+            thumbnail=self._get_thumbnail_url(media_item),
         )
 
     async def _get_children(
-        self, parent_id: str, item_type: str
-    ) -> list[dict[str, Any]]:
-        """Return all children for the parent_id whose item type is item_type."""
+        self,
+        parent_id: str,
+        item_type: str,
+        sort_by: str | None = None,
+        page: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Return a page of children for the parent_id whose item type is item_type.
+
+        The total number of children is returned along with the page.
+        """
+        start_index = page * BROWSE_PAGE_SIZE
         params = {
             "Recursive": "true",
             "ParentId": parent_id,
             "IncludeItemTypes": item_type,
+            "StartIndex": str(start_index),
+            "Limit": str(BROWSE_PAGE_SIZE),
+            # Only the primary image is used for thumbnails
+            "EnableImageTypes": "Primary",
+            "ImageTypeLimit": "1",
+            "EnableUserData": "false",
         }
         if item_type in PLAYABLE_ITEM_TYPES:
             params["Fields"] = ITEM_KEY_MEDIA_SOURCES
+        if sort_by is not None:
+            params["SortBy"] = sort_by
+            params["SortOrder"] = "Ascending"
+
+        result = await self._async_get_cached(
+            self._items_cache,
+            (parent_id, item_type, sort_by, page),
+            self.api.user_items,
+            "",
+            params,
+        )
+        items: list[dict[str, Any]] = result["Items"]
+        return items, result.get("TotalRecordCount", start_index + len(items))
 
-        result = await self.hass.async_add_executor_job(self.api.user_items, "", params)
-        return result["Items"]  # type: ignore[no-any-return]
+    async def _get_item(self, item_id: str) -> dict[str, Any]:
+        """Return a single media item."""
+        return await self._async_get_cached(  # type: ignore[no-any-return]
+            self._item_cache, item_id, self.api.get_item, item_id
+        )
+
+    async def _async_get_cached(
+        self,
+        cache: dict[Hashable, tuple[float, asyncio.Future[Any]]],
+        key: Hashable,
+        target: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Return the result of an API call, reusing a recent or in-flight call."""
+        now = time.monotonic()
+        for cached_key in [
+            cached_key
+            for cached_key, (timestamp, _) in cache.items()
+            if now - timestamp >= BROWSE_CACHE_TTL
+        ]:
+            del cache[cached_key]
+
+        if (cached := cache.get(key)) is not None:
+            return await asyncio.shield(cached[1])
+
+        future = self.hass.async_add_executor_job(target, *args)
+        cache[key] = (now, future)
+
+        def _evict_failed(future: asyncio.Future[Any]) -> None:
+            """Do not keep failed calls around."""
+            if future.cancelled() or future.exception() is not None:
+                if (cached := cache.get(key)) is not None and cached[1] is future:
+                    del cache[key]
+
+        future.add_done_callback(_evict_failed)
+        return await asyncio.shield(future)
 
     def _get_thumbnail_url(self, media_item: dict[str, Any]) -> str | None:
         """Return the URL for the primary image of a media item if available."""
         image_tags = media_item[ITEM_KEY_IMAGE_TAGS]
 
-        if "Primary" not in image_tags:
+        if (image_tag := image_tags.get("Primary")) is None:
             return None
 
-        item_id = media_item[ITEM_KEY_ID]
-        return str(self.api.artwork(item_id, "Primary", MAX_IMAGE_WIDTH))
+        if self._artwork_query is None:
+            params = {"MaxWidth": MAX_IMAGE_WIDTH, "format": "jpg"}
+            if token := self.client.config.data.get("auth.token"):
+                params["api_key"] = token
+            self._artwork_query = urlencode(params)
 
-    def _get_stream_url(self, media_item: dict[str, Any]) -> str:
-        """Return the stream URL for a media item."""
-        media_type = media_item[ITEM_KEY_MEDIA_TYPE]
         item_id = media_item[ITEM_KEY_ID]
+        # The image tag changes with the image, so browsers can cache it for long
+        return (
+            f"{self.url}Items/{item_id}/Images/Primary"
+            f"?{self._artwork_query}&tag={image_tag}"
+        )
 
+    def _expire_resolve_cache(self) -> None:
+        """Drop playable items that were browsed too long ago."""
+        now = time.monotonic()
+        for item_id in [
+            item_id
+            for item_id, (timestamp, _, _) in self._resolve_cache.items()
+            if now - timestamp >= BROWSE_CACHE_TTL
+        ]:
+            del self._resolve_cache[item_id]
+
+    def _remember_playable(self, media_item: dict[str, Any], mime_type: str) -> None:
+        """Store what is needed to resolve a playable item without fetching it."""
+        if (media_type := media_item.get(ITEM_KEY_MEDIA_TYPE)) is not None:
+            self._resolve_cache[media_item[ITEM_KEY_ID]] = (
+                time.monotonic(),
+                media_type,
+                mime_type,
+            )
+
+    def _get_stream_url(self, item_id: str, media_type: str) -> str:
+        """Return the stream URL for a media item."""
         if media_type == MEDIA_TYPE_AUDIO:
             if audio_codec := self.entry.options.get(CONF_AUDIO_CODEC):
                 return self.api.audio_url(item_id, audio_codec=audio_codec)  # type: ignore[no-any-return]
@@ -537,6 +673,48 @@ class JellyfinSource(MediaSource):
         raise BrowseError(f"Unsupported media type {media_type}")
 
 
+def _parse_identifier(identifier: str) -> tuple[str, int]:
+    """Return the item id and page number of a media source identifier."""
+    item_id, _, query = identifier.partition("?")
+    if not query:
+        return item_id, 0
+
+    try:
+        page = int(query.removeprefix("page="))
+    except ValueError:
+        page = -1
+    if page < 0:
+        raise BrowseError(f"Invalid page in identifier {identifier}")
+
+    return item_id, page
+
+
+def _missing_last(
+    items: list[dict[str, Any]], key: str, total: int
+) -> list[dict[str, Any]]:
+    """Return the items in server order, with items missing the key last.
+
+    Items are only reordered when all children fit on a single page, otherwise
+    the server order is kept so that it stays consistent across pages.
+    """
+    if len(items) <= 1 or total > BROWSE_PAGE_SIZE:
+        return items
+    return [item for item in items if key in item] + [
+        item for item in items if key not in item
+    ]
+
+
+def _playable_items(
+    items: list[dict[str, Any]], key: str, total: int
+) -> list[tuple[dict[str, Any], str]]:
+    """Return the playable items with their mime type, with items missing key last."""
+    return [
+        (item, mime_type)
+        for item in _missing_last(items, key, total)
+        if (mime_type := _media_mime_type(item)) is not None
+    ]
+
+
 def _media_mime_type(media_item: dict[str, Any]) -> str | None:
     """Return the mime type of a media item."""
     if not media_item.get(ITEM_KEY_MEDIA_SOURCES):
@@ -550,11 +728,18 @@ def _media_mime_type(media_item: dict[str, Any]) -> str | None:
         return None
 
     path = media_source[MEDIA_SOURCE_KEY_PATH]
-    mime_type, _ = mimetypes.guess_type(path)
+    mime_type = _guess_mime_type(os.path.splitext(path)[1].lower())
 
-    if mime_type is None:
+    if mime_type is None and _LOGGER.isEnabledFor(logging.DEBUG):
         _LOGGER.debug(
             "Unable to determine mime type for path %s", os.path.basename(path)
         )
 
     return mime_type
+
+
+@lru_cache(maxsize=256)
+def _guess_mime_type(extension: str) -> str | None:
+    """Return the mime type for a file extension."""
+    mime_type, _ = mimetypes.guess_type(f"file{extension}")
+    return mime_type
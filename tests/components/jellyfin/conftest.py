@@ -9,6 +9,7 @@ from jellyfin_apiclient_python import JellyfinClient
 from jellyfin_apiclient_python.api import API
 from jellyfin_apiclient_python.configuration import Config
 from jellyfin_apiclient_python.connection_manager import ConnectionManager
+from jellyfin_apiclient_python.http import HTTP
 import pytest
 
 from homeassistant.components.jellyfin.const import DOMAIN
@@ -102,6 +103,7 @@ def mock_client(
     jf_client = create_autospec(JellyfinClient)
     jf_client.auth = mock_auth
     jf_client.config = mock_config
+    jf_client.http = create_autospec(HTTP)
     jf_client.jellyfin = mock_api
 
     return jf_client
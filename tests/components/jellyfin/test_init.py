@@ -31,6 +31,7 @@ async def test_config_entry_not_ready(
     await hass.async_block_till_done()
 
     assert mock_config_entry.state is ConfigEntryState.SETUP_RETRY
+    mock_client.http.start_session.assert_not_called()
 
 
 async def test_invalid_auth(
@@ -56,12 +57,14 @@ async def test_invalid_auth(
     flows = hass.config_entries.flow.async_progress()
     assert len(flows) == 1
     assert flows[0]["context"]["source"] == SOURCE_REAUTH
+    mock_client.http.start_session.assert_not_called()
 
 
 async def test_load_unload_config_entry(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
     mock_jellyfin: MagicMock,
+    mock_client: MagicMock,
 ) -> None:
     """Test the Jellyfin configuration entry loading/unloading."""
     mock_config_entry.add_to_hass(hass)
@@ -69,6 +72,8 @@ async def test_load_unload_config_entry(
     await hass.async_block_till_done()
 
     assert mock_config_entry.state is ConfigEntryState.LOADED
+    mock_client.http.start_session.assert_called_once()
+    assert mock_client.http.keep_alive
 
     await hass.config_entries.async_unload(mock_config_entry.entry_id)
     await hass.async_block_till_done()
@@ -1,15 +1,26 @@
 """Tests for the Jellyfin media_player platform."""
 
-from unittest.mock import MagicMock
-
+import asyncio
+from datetime import timedelta
+from unittest.mock import MagicMock, create_autospec
+
+from freezegun.api import FrozenDateTimeFactory
+from jellyfin_apiclient_python import JellyfinClient
+from jellyfin_apiclient_python.api import API
+from jellyfin_apiclient_python.exceptions import HTTPException
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from homeassistant.components.jellyfin.const import DOMAIN
-from homeassistant.components.media_player import BrowseError
+from homeassistant.components.jellyfin.const import (
+    BROWSE_CACHE_TTL,
+    BROWSE_PAGE_SIZE,
+    DOMAIN,
+)
+from homeassistant.components.media_player import BrowseError, MediaClass
 from homeassistant.components.media_source import (
     DOMAIN as MEDIA_SOURCE_DOMAIN,
     URI_SCHEME,
+    Unresolvable,
     async_browse_media,
     async_resolve_media,
 )
@@ -135,6 +146,7 @@ async def test_tv_library(
     init_integration: MockConfigEntry,
     mock_jellyfin: MagicMock,
     mock_api: MagicMock,
+    freezer: FrozenDateTimeFactory,
     snapshot: SnapshotAssertion,
 ) -> None:
     """Test browsing a Jellyfin TV Library."""
@@ -155,6 +167,7 @@ async def test_tv_library(
     assert browse.children == []
 
     # Test browsing a tv library containing series
+    freezer.tick(timedelta(seconds=BROWSE_CACHE_TTL))
     mock_api.user_items.side_effect = None
     mock_api.user_items.return_value = load_json_fixture("series-list.json")
 
@@ -200,6 +213,7 @@ async def test_movie_library(
     init_integration: MockConfigEntry,
     mock_jellyfin: MagicMock,
     mock_api: MagicMock,
+    freezer: FrozenDateTimeFactory,
     snapshot: SnapshotAssertion,
 ) -> None:
     """Test browsing a Jellyfin Movie Library."""
@@ -220,6 +234,7 @@ async def test_movie_library(
     assert browse.children == []
 
     # Test browsing a movie library containing movies
+    freezer.tick(timedelta(seconds=BROWSE_CACHE_TTL))
     mock_api.user_items.side_effect = None
     mock_api.user_items.return_value = load_json_fixture("movies.json")
 
@@ -239,6 +254,7 @@ async def test_music_library(
     init_integration: MockConfigEntry,
     mock_jellyfin: MagicMock,
     mock_api: MagicMock,
+    freezer: FrozenDateTimeFactory,
     snapshot: SnapshotAssertion,
 ) -> None:
     """Test browsing a Jellyfin Music Library."""
@@ -259,6 +275,7 @@ async def test_music_library(
     assert browse.children == []
 
     # Test browsing a music library containing albums
+    freezer.tick(timedelta(seconds=BROWSE_CACHE_TTL))
     mock_api.user_items.side_effect = None
     mock_api.user_items.return_value = load_json_fixture("albums.json")
 
@@ -271,6 +288,22 @@ async def test_music_library(
     assert browse.title == "Music"
     assert vars(browse.children[0]) == snapshot
 
+    # Test browsing past the last page of artists does not fall back to albums
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("music-collection.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = {"Items": [], "TotalRecordCount": 1}
+    mock_api.user_items.reset_mock()
+
+    browse = await async_browse_media(
+        hass, f"{URI_SCHEME}{DOMAIN}/MUSIC-COLLECTION-FOLDER-UUID?page=1"
+    )
+
+    assert browse.children_media_class == MediaClass.ARTIST
+    assert browse.children == []
+    mock_api.user_items.assert_called_once()
+    assert mock_api.user_items.call_args[0][1]["IncludeItemTypes"] == "MusicArtist"
+
     # Test browsing an artist
     mock_api.get_item.side_effect = None
     mock_api.get_item.return_value = load_json_fixture("artist.json")
@@ -298,6 +331,7 @@ async def test_music_library(
     assert vars(browse.children[0]) == snapshot
 
     # Test browsing an album with a track with no source
+    freezer.tick(timedelta(seconds=BROWSE_CACHE_TTL))
     mock_api.user_items.side_effect = None
     mock_api.user_items.return_value = load_json_fixture("tracks-nosource.json")
 
@@ -310,6 +344,7 @@ async def test_music_library(
     assert browse.children == []
 
     # Test browsing an album with a track with no path
+    freezer.tick(timedelta(seconds=BROWSE_CACHE_TTL))
     mock_api.user_items.side_effect = None
     mock_api.user_items.return_value = load_json_fixture("tracks-nopath.json")
 
@@ -322,6 +357,7 @@ async def test_music_library(
     assert browse.children == []
 
     # Test browsing an album with a track with an unknown file extension
+    freezer.tick(timedelta(seconds=BROWSE_CACHE_TTL))
     mock_api.user_items.side_effect = None
     mock_api.user_items.return_value = load_json_fixture(
         "tracks-unknown-extension.json"
@@ -350,3 +386,383 @@ async def test_browse_unsupported(
 
     with pytest.raises(BrowseError):
         await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/UNSUPPORTED-ITEM-UUID")
+
+
+async def test_root_prefetches_library_children(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test browsing the root warms up the children of each library."""
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = load_json_fixture("series-list.json")
+
+    await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}")
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert mock_api.user_items.call_count == 1
+
+    library = load_json_fixture("tv-collection.json")
+    library["Id"] = "COLLECTION-FOLDER-UUID"
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = library
+
+    browse = await async_browse_media(
+        hass, f"{URI_SCHEME}{DOMAIN}/COLLECTION-FOLDER-UUID"
+    )
+
+    assert browse.identifier == "COLLECTION-FOLDER-UUID"
+    assert len(browse.children) == 1
+    assert mock_api.user_items.call_count == 1
+
+    # Prefetched children expire with the browse cache
+    freezer.tick(timedelta(seconds=BROWSE_CACHE_TTL))
+    await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/COLLECTION-FOLDER-UUID")
+    assert mock_api.user_items.call_count == 2
+
+
+async def test_root_prefetch_failure(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+) -> None:
+    """Test a failing prefetch does not affect browsing."""
+    mock_api.user_items.side_effect = HTTPException("ServerUnreachable", None)
+
+    browse = await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}")
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert len(browse.children) == 1
+    assert mock_api.user_items.call_count == 1
+
+    library = load_json_fixture("tv-collection.json")
+    library["Id"] = "COLLECTION-FOLDER-UUID"
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = library
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = load_json_fixture("series-list.json")
+
+    # The failed call is not cached
+    browse = await async_browse_media(
+        hass, f"{URI_SCHEME}{DOMAIN}/COLLECTION-FOLDER-UUID"
+    )
+
+    assert len(browse.children) == 1
+    assert mock_api.user_items.call_count == 2
+
+
+async def test_browse_cache(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test repeated browsing is served from the cache until it expires."""
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("tv-collection.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = load_json_fixture("series-list.json")
+
+    for _ in range(2):
+        browse = await async_browse_media(
+            hass, f"{URI_SCHEME}{DOMAIN}/TV-COLLECTION-FOLDER-UUID"
+        )
+        assert len(browse.children) == 1
+
+    assert mock_api.get_item.call_count == 1
+    assert mock_api.user_items.call_count == 1
+
+    freezer.tick(timedelta(seconds=BROWSE_CACHE_TTL))
+
+    await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/TV-COLLECTION-FOLDER-UUID")
+
+    assert mock_api.get_item.call_count == 2
+    assert mock_api.user_items.call_count == 2
+
+
+async def test_browse_pagination(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+) -> None:
+    """Test browsing a library with more children than fit on a page."""
+    series_list = load_json_fixture("series-list.json")
+    series_list["TotalRecordCount"] = BROWSE_PAGE_SIZE + 1
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("tv-collection.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = series_list
+
+    browse = await async_browse_media(
+        hass, f"{URI_SCHEME}{DOMAIN}/TV-COLLECTION-FOLDER-UUID"
+    )
+
+    assert len(browse.children) == 2
+    next_page = browse.children[-1]
+    assert next_page.identifier == "TV-COLLECTION-FOLDER-UUID?page=1"
+    assert next_page.can_expand
+    params = mock_api.user_items.call_args[0][1]
+    assert params["StartIndex"] == "0"
+    assert params["Limit"] == str(BROWSE_PAGE_SIZE)
+
+    browse = await async_browse_media(
+        hass, f"{URI_SCHEME}{DOMAIN}/TV-COLLECTION-FOLDER-UUID?page=1"
+    )
+
+    assert browse.identifier == "TV-COLLECTION-FOLDER-UUID?page=1"
+    assert browse.title == "TVShows (page 2)"
+    assert len(browse.children) == 1
+    mock_api.get_item.assert_called_once_with("TV-COLLECTION-FOLDER-UUID")
+    params = mock_api.user_items.call_args[0][1]
+    assert params["StartIndex"] == str(BROWSE_PAGE_SIZE)
+
+    with pytest.raises(BrowseError):
+        await async_browse_media(
+            hass, f"{URI_SCHEME}{DOMAIN}/TV-COLLECTION-FOLDER-UUID?page=x"
+        )
+
+
+async def test_resolve_browsed_item(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+) -> None:
+    """Test resolving an item seen while browsing does not fetch it again."""
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("album.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = load_json_fixture("tracks.json")
+
+    await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+    mock_api.get_item.reset_mock()
+
+    play_media = await async_resolve_media(
+        hass, f"{URI_SCHEME}{DOMAIN}/TRACK-UUID", "media_player.jellyfin_device"
+    )
+
+    assert play_media.mime_type == "audio/flac"
+    mock_api.audio_url.assert_called_once_with("TRACK-UUID")
+    mock_api.get_item.assert_not_called()
+
+
+async def test_concurrent_browse_shares_requests(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+) -> None:
+    """Test concurrent browsing of the same item shares the API calls."""
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("tv-collection.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = load_json_fixture("series-list.json")
+
+    first, second = await asyncio.gather(
+        async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/TV-COLLECTION-FOLDER-UUID"),
+        async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/TV-COLLECTION-FOLDER-UUID"),
+    )
+
+    assert vars(first.children[0]) == vars(second.children[0])
+    mock_api.get_item.assert_called_once_with("TV-COLLECTION-FOLDER-UUID")
+    assert mock_api.user_items.call_count == 1
+
+
+async def test_browse_keeps_server_order(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+) -> None:
+    """Test children keep the server order with items missing the key last."""
+    tracks = load_json_fixture("tracks.json")
+    track = tracks["Items"][0]
+    unindexed = {**track, "Id": "TRACK-UNINDEXED-UUID"}
+    unindexed.pop("IndexNumber", None)
+    tracks["Items"] = [
+        unindexed,
+        {**track, "Id": "TRACK-1-UUID", "IndexNumber": 1},
+        {**track, "Id": "TRACK-2-UUID", "IndexNumber": 2},
+    ]
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("album.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = tracks
+
+    browse = await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+
+    assert [child.identifier for child in browse.children] == [
+        "TRACK-1-UUID",
+        "TRACK-2-UUID",
+        "TRACK-UNINDEXED-UUID",
+    ]
+    params = mock_api.user_items.call_args[0][1]
+    assert params["SortBy"] == "IndexNumber,SortName"
+    assert params["SortOrder"] == "Ascending"
+
+
+async def test_browse_keeps_server_order_across_pages(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+) -> None:
+    """Test children spanning several pages are not reordered within a page."""
+    tracks = load_json_fixture("tracks.json")
+    track = tracks["Items"][0]
+    unindexed = {**track, "Id": "TRACK-UNINDEXED-UUID"}
+    unindexed.pop("IndexNumber", None)
+    tracks["Items"] = [
+        unindexed,
+        {**track, "Id": "TRACK-1-UUID", "IndexNumber": 1},
+    ]
+    tracks["TotalRecordCount"] = BROWSE_PAGE_SIZE + 1
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("album.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = tracks
+
+    browse = await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+
+    assert [child.identifier for child in browse.children] == [
+        "TRACK-UNINDEXED-UUID",
+        "TRACK-1-UUID",
+        "ALBUM-UUID?page=1",
+    ]
+
+
+async def test_resolve_browsed_item_expired(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test resolving an item browsed too long ago fetches it again."""
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("album.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = load_json_fixture("tracks.json")
+
+    await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+    mock_api.get_item.reset_mock()
+    mock_api.get_item.return_value = load_json_fixture("track.json")
+
+    freezer.tick(timedelta(seconds=BROWSE_CACHE_TTL))
+
+    play_media = await async_resolve_media(
+        hass, f"{URI_SCHEME}{DOMAIN}/TRACK-UUID", "media_player.jellyfin_device"
+    )
+
+    assert play_media.mime_type == "audio/flac"
+    mock_api.get_item.assert_called_once_with("TRACK-UUID")
+
+
+async def test_client_replaced_on_reload(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+) -> None:
+    """Test a new client after a reload rebuilds the URL and caches."""
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("album.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = load_json_fixture("tracks.json")
+
+    browse = await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+    assert browse.children[0].thumbnail.startswith("http://localhost/Items/")
+
+    new_api = create_autospec(API)
+    new_api.get_item.return_value = load_json_fixture("album.json")
+    new_api.user_items.return_value = load_json_fixture("tracks.json")
+    new_client = create_autospec(JellyfinClient)
+    new_client.config = MagicMock()
+    new_client.config.data = {"auth.server": "http://remote"}
+    new_client.jellyfin = new_api
+    init_integration.runtime_data.api_client = new_client
+
+    browse = await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+
+    assert browse.children[0].thumbnail.startswith("http://remote/Items/")
+    new_api.get_item.assert_called_once_with("ALBUM-UUID")
+    assert new_api.user_items.call_count == 1
+    assert mock_api.get_item.call_count == 1
+    assert mock_api.user_items.call_count == 1
+
+
+async def test_browse_not_loaded(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+) -> None:
+    """Test browsing and resolving after the config entry is unloaded."""
+    await hass.config_entries.async_unload(init_integration.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(BrowseError):
+        await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+
+    with pytest.raises(Unresolvable):
+        await async_resolve_media(
+            hass, f"{URI_SCHEME}{DOMAIN}/TRACK-UUID", "media_player.jellyfin_device"
+        )
+
+
+async def test_browse_after_entry_replaced(
+    hass: HomeAssistant,
+    mock_client: MagicMock,
+    init_integration: MockConfigEntry,
+    mock_jellyfin: MagicMock,
+    mock_api: MagicMock,
+) -> None:
+    """Test browsing follows a config entry that was removed and added again."""
+    mock_api.get_item.side_effect = None
+    mock_api.get_item.return_value = load_json_fixture("album.json")
+    mock_api.user_items.side_effect = None
+    mock_api.user_items.return_value = load_json_fixture("tracks.json")
+
+    await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+
+    await hass.config_entries.async_remove(init_integration.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(BrowseError):
+        await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+
+    new_entry = MockConfigEntry(
+        title="Jellyfin",
+        domain=DOMAIN,
+        data=dict(init_integration.data),
+        unique_id="USER-UUID",
+    )
+    new_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(new_entry.entry_id)
+    await hass.async_block_till_done()
+
+    browse = await async_browse_media(hass, f"{URI_SCHEME}{DOMAIN}/ALBUM-UUID")
+
+    assert browse.identifier == "ALBUM-UUID"
+    assert mock_api.get_item.call_count == 2
+
+    play_media = await async_resolve_media(
+        hass, f"{URI_SCHEME}{DOMAIN}/TRACK-UUID", "media_player.jellyfin_device"
+    )
+
+    assert play_media.mime_type == "audio/flac"